@@ -0,0 +1,80 @@
+# Import standard libraries.
+import functools
+
+
+def literal(value):
+    """
+    Returns the source code for a parameter as a float literal.
+
+    Parameters
+    ----------
+    value : float
+        The value of the parameter.
+
+    Returns
+    -------
+    str
+        The float literal, in brackets so negative values are safe to
+        substitute into any expression.
+    """
+
+    return f"({float(value)!r})"
+
+
+@functools.lru_cache(maxsize=128)
+def compile_step(name, rhs):
+    """
+    Generates and compiles a function which performs a single step of
+    the 4th order Runge-Kutta method for a strange attractor.
+
+    The differential equations are inlined into each of the four stages
+    of the method, with the parameters of the strange attractor already
+    substituted as literals, so the function avoids any calls or
+    attribute lookups. Functions are cached on their source code, which
+    contains the parameters, so each set of parameters is only compiled
+    once.
+
+    Parameters
+    ----------
+    name : str
+        The strange attractor the function is generated for.
+    rhs : str
+        The source code which assigns the differential equations to dx,
+        dy and dz from the cartesian coordinates x, y and z, one
+        statement per line.
+
+    Returns
+    -------
+    function
+        The function step(x, y, z, dt), which returns the cartesian
+        coordinates after one step.
+    """
+
+    body = "".join(f"    {line.strip()}\n" for line in rhs.strip().splitlines())
+
+    src = (
+        "def step(x0, y0, z0, dt):\n"
+        "    dt_half = 0.5 * dt\n"
+        "    x, y, z = x0, y0, z0\n"
+        f"{body}"
+        "    k1x, k1y, k1z = dx, dy, dz\n"
+        "    x, y, z = x0 + (dt_half * k1x), y0 + (dt_half * k1y), z0 + (dt_half * k1z)\n"
+        f"{body}"
+        "    k2x, k2y, k2z = dx, dy, dz\n"
+        "    x, y, z = x0 + (dt_half * k2x), y0 + (dt_half * k2y), z0 + (dt_half * k2z)\n"
+        f"{body}"
+        "    k3x, k3y, k3z = dx, dy, dz\n"
+        "    x, y, z = x0 + (dt * k3x), y0 + (dt * k3y), z0 + (dt * k3z)\n"
+        f"{body}"
+        "    dt_sixth = dt / 6\n"
+        "    return (\n"
+        "        x0 + (dt_sixth * (k1x + (2 * (k2x + k3x)) + dx)),\n"
+        "        y0 + (dt_sixth * (k1y + (2 * (k2y + k3y)) + dy)),\n"
+        "        z0 + (dt_sixth * (k1z + (2 * (k2z + k3z)) + dz)),\n"
+        "    )\n"
+    )
+
+    namespace = {}
+    exec(compile(src, f"<{name} rk4 step>", "exec"), namespace)
+
+    return namespace["step"]
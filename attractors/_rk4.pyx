@@ -0,0 +1,273 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+# distutils: extra_compile_args = -O3 -march=native
+
+# Import external libraries.
+import numpy as np
+
+
+cdef struct LangfordParams:
+    double a, b, c, d, e, f
+
+cdef struct LorenzParams:
+    double beta, rho, sigma
+
+cdef struct RosslerParams:
+    double a, b, c
+
+cdef struct SprottParams:
+    double a, b
+
+
+cdef inline void langford_rhs(LangfordParams* p, double x, double y, double z, double* out) noexcept nogil:
+    cdef double x2 = x * x, y2 = y * y, z2 = z * z
+    out[0] = ((z - p.b) * x) - (p.d * y)
+    out[1] = (p.d * x) + ((z - p.b) * y)
+    out[2] = p.c + (p.a * z) - ((z2 * z) / 3) - ((x2 + y2) * (1 + (p.e * z))) + (p.f * z * (x2 * x))
+
+
+cdef inline void lorenz_rhs(LorenzParams* p, double x, double y, double z, double* out) noexcept nogil:
+    out[0] = p.sigma * (y - x)
+    out[1] = (x * (p.rho - z)) - y
+    out[2] = (x * y) - (p.beta * z)
+
+
+cdef inline void rossler_rhs(RosslerParams* p, double x, double y, double z, double* out) noexcept nogil:
+    out[0] = - y - z
+    out[1] = x + (p.a * y)
+    out[2] = p.b + (z * (x - p.c))
+
+
+cdef inline void sprott_rhs(SprottParams* p, double x, double y, double z, double* out) noexcept nogil:
+    cdef double x2 = x * x
+    out[0] = y + (p.a * x * y) + (x * z)
+    out[1] = 1 - (p.b * x2) + (y * z)
+    out[2] = x - x2 - (y * y)
+
+
+cpdef rk4_langford(double a, double b, double c, double d, double e, double f, double[::1] init, double dt, Py_ssize_t steps):
+    """
+    Solves the ODE's (differential equations) for a Langford attractor
+    using the 4th order Runge-Kutta method, compiled with Cython.
+
+    Parameters
+    ----------
+    a, b, c, d, e, f : float
+        The parameters for the Langford attractor.
+    init : numpy.ndarray
+        The initial cartesian coordinates of the strange attractor.
+    dt : float
+        The step size.
+    steps : int
+        The number of steps to use for the simulation.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The coordinates and time for the entire simulation, with shape
+        (4, steps + 1).
+    """
+
+    cdef LangfordParams p = LangfordParams(a, b, c, d, e, f)
+    cdef double k1[3]
+    cdef double k2[3]
+    cdef double k3[3]
+    cdef double k4[3]
+    cdef double x, y, z
+    cdef double dt_half = 0.5 * dt, dt_sixth = dt / 6
+    cdef Py_ssize_t i
+
+    data = np.empty((4, steps + 1))
+    cdef double[:, ::1] out = data
+
+    x, y, z = init[0], init[1], init[2]
+    out[0, 0], out[1, 0], out[2, 0] = x, y, z
+
+    with nogil:
+        for i in range(steps):
+            langford_rhs(&p, x, y, z, k1)
+            langford_rhs(&p, x + (dt_half * k1[0]), y + (dt_half * k1[1]), z + (dt_half * k1[2]), k2)
+            langford_rhs(&p, x + (dt_half * k2[0]), y + (dt_half * k2[1]), z + (dt_half * k2[2]), k3)
+            langford_rhs(&p, x + (dt * k3[0]), y + (dt * k3[1]), z + (dt * k3[2]), k4)
+
+            x = x + (dt_sixth * (k1[0] + (2 * (k2[0] + k3[0])) + k4[0]))
+            y = y + (dt_sixth * (k1[1] + (2 * (k2[1] + k3[1])) + k4[1]))
+            z = z + (dt_sixth * (k1[2] + (2 * (k2[2] + k3[2])) + k4[2]))
+
+            out[0, i + 1], out[1, i + 1], out[2, i + 1] = x, y, z
+
+    data[3] = np.linspace(0, dt * steps, steps + 1)
+    return data
+
+
+cpdef rk4_lorenz(double beta, double rho, double sigma, double[::1] init, double dt, Py_ssize_t steps):
+    """
+    Solves the ODE's (differential equations) for a Lorenz attractor
+    using the 4th order Runge-Kutta method, compiled with Cython.
+
+    Parameters
+    ----------
+    beta, rho, sigma : float
+        The parameters for the Lorenz attractor.
+    init : numpy.ndarray
+        The initial cartesian coordinates of the strange attractor.
+    dt : float
+        The step size.
+    steps : int
+        The number of steps to use for the simulation.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The coordinates and time for the entire simulation, with shape
+        (4, steps + 1).
+    """
+
+    cdef LorenzParams p = LorenzParams(beta, rho, sigma)
+    cdef double k1[3]
+    cdef double k2[3]
+    cdef double k3[3]
+    cdef double k4[3]
+    cdef double x, y, z
+    cdef double dt_half = 0.5 * dt, dt_sixth = dt / 6
+    cdef Py_ssize_t i
+
+    data = np.empty((4, steps + 1))
+    cdef double[:, ::1] out = data
+
+    x, y, z = init[0], init[1], init[2]
+    out[0, 0], out[1, 0], out[2, 0] = x, y, z
+
+    with nogil:
+        for i in range(steps):
+            lorenz_rhs(&p, x, y, z, k1)
+            lorenz_rhs(&p, x + (dt_half * k1[0]), y + (dt_half * k1[1]), z + (dt_half * k1[2]), k2)
+            lorenz_rhs(&p, x + (dt_half * k2[0]), y + (dt_half * k2[1]), z + (dt_half * k2[2]), k3)
+            lorenz_rhs(&p, x + (dt * k3[0]), y + (dt * k3[1]), z + (dt * k3[2]), k4)
+
+            x = x + (dt_sixth * (k1[0] + (2 * (k2[0] + k3[0])) + k4[0]))
+            y = y + (dt_sixth * (k1[1] + (2 * (k2[1] + k3[1])) + k4[1]))
+            z = z + (dt_sixth * (k1[2] + (2 * (k2[2] + k3[2])) + k4[2]))
+
+            out[0, i + 1], out[1, i + 1], out[2, i + 1] = x, y, z
+
+    data[3] = np.linspace(0, dt * steps, steps + 1)
+    return data
+
+
+cpdef rk4_rossler(double a, double b, double c, double[::1] init, double dt, Py_ssize_t steps):
+    """
+    Solves the ODE's (differential equations) for a Rossler attractor
+    using the 4th order Runge-Kutta method, compiled with Cython.
+
+    Parameters
+    ----------
+    a, b, c : float
+        The parameters for the Rossler attractor.
+    init : numpy.ndarray
+        The initial cartesian coordinates of the strange attractor.
+    dt : float
+        The step size.
+    steps : int
+        The number of steps to use for the simulation.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The coordinates and time for the entire simulation, with shape
+        (4, steps + 1).
+    """
+
+    cdef RosslerParams p = RosslerParams(a, b, c)
+    cdef double k1[3]
+    cdef double k2[3]
+    cdef double k3[3]
+    cdef double k4[3]
+    cdef double x, y, z
+    cdef double dt_half = 0.5 * dt, dt_sixth = dt / 6
+    cdef Py_ssize_t i
+
+    data = np.empty((4, steps + 1))
+    cdef double[:, ::1] out = data
+
+    x, y, z = init[0], init[1], init[2]
+    out[0, 0], out[1, 0], out[2, 0] = x, y, z
+
+    with nogil:
+        for i in range(steps):
+            rossler_rhs(&p, x, y, z, k1)
+            rossler_rhs(&p, x + (dt_half * k1[0]), y + (dt_half * k1[1]), z + (dt_half * k1[2]), k2)
+            rossler_rhs(&p, x + (dt_half * k2[0]), y + (dt_half * k2[1]), z + (dt_half * k2[2]), k3)
+            rossler_rhs(&p, x + (dt * k3[0]), y + (dt * k3[1]), z + (dt * k3[2]), k4)
+
+            x = x + (dt_sixth * (k1[0] + (2 * (k2[0] + k3[0])) + k4[0]))
+            y = y + (dt_sixth * (k1[1] + (2 * (k2[1] + k3[1])) + k4[1]))
+            z = z + (dt_sixth * (k1[2] + (2 * (k2[2] + k3[2])) + k4[2]))
+
+            out[0, i + 1], out[1, i + 1], out[2, i + 1] = x, y, z
+
+    data[3] = np.linspace(0, dt * steps, steps + 1)
+    return data
+
+
+cpdef rk4_sprott(double a, double b, double[::1] init, double dt, Py_ssize_t steps):
+    """
+    Solves the ODE's (differential equations) for a Sprott attractor
+    using the 4th order Runge-Kutta method, compiled with Cython.
+
+    Parameters
+    ----------
+    a, b : float
+        The parameters for the Sprott attractor.
+    init : numpy.ndarray
+        The initial cartesian coordinates of the strange attractor.
+    dt : float
+        The step size.
+    steps : int
+        The number of steps to use for the simulation.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The coordinates and time for the entire simulation, with shape
+        (4, steps + 1).
+    """
+
+    cdef SprottParams p = SprottParams(a, b)
+    cdef double k1[3]
+    cdef double k2[3]
+    cdef double k3[3]
+    cdef double k4[3]
+    cdef double x, y, z
+    cdef double dt_half = 0.5 * dt, dt_sixth = dt / 6
+    cdef Py_ssize_t i
+
+    data = np.empty((4, steps + 1))
+    cdef double[:, ::1] out = data
+
+    x, y, z = init[0], init[1], init[2]
+    out[0, 0], out[1, 0], out[2, 0] = x, y, z
+
+    with nogil:
+        for i in range(steps):
+            sprott_rhs(&p, x, y, z, k1)
+            sprott_rhs(&p, x + (dt_half * k1[0]), y + (dt_half * k1[1]), z + (dt_half * k1[2]), k2)
+            sprott_rhs(&p, x + (dt_half * k2[0]), y + (dt_half * k2[1]), z + (dt_half * k2[2]), k3)
+            sprott_rhs(&p, x + (dt * k3[0]), y + (dt * k3[1]), z + (dt * k3[2]), k4)
+
+            x = x + (dt_sixth * (k1[0] + (2 * (k2[0] + k3[0])) + k4[0]))
+            y = y + (dt_sixth * (k1[1] + (2 * (k2[1] + k3[1])) + k4[1]))
+            z = z + (dt_sixth * (k1[2] + (2 * (k2[2] + k3[2])) + k4[2]))
+
+            out[0, i + 1], out[1, i + 1], out[2, i + 1] = x, y, z
+
+    data[3] = np.linspace(0, dt * steps, steps + 1)
+    return data
+
+
+# Map each strange attractor to its compiled 4th order Runge-Kutta method.
+KERNELS = {
+    "langford": rk4_langford,
+    "lorenz": rk4_lorenz,
+    "rossler": rk4_rossler,
+    "sprott": rk4_sprott,
+}
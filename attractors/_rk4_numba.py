@@ -0,0 +1,296 @@
+# Import external libraries.
+from numba import njit
+import numpy as np
+
+
+@njit(cache=True, fastmath=True)
+def rk4_langford(a, b, c, d, e, f, x0, y0, z0, dt, steps, dtype):
+    """
+    Solves the ODE's (differential equations) for a Langford attractor
+    using the 4th order Runge-Kutta method, compiled with Numba.
+
+    Parameters
+    ----------
+    a, b, c, d, e, f : float
+        The parameters for the Langford attractor.
+    x0, y0, z0 : float
+        The initial cartesian coordinates of the strange attractor.
+    dt : float
+        The step size.
+    steps : int
+        The number of steps to use for the simulation.
+    dtype : type
+        The floating point type of the simulation, such as numpy.float32.
+        The parameters, initial coordinates and step size should
+        already be of this type.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The coordinates and time for the entire simulation, with shape
+        (4, steps + 1).
+    """
+
+    data = np.empty((4, steps + 1), dtype)
+    x, y, z = data[0], data[1], data[2]
+
+    x[0], y[0], z[0] = x0, y0, z0
+
+    # Build the constants with the floating point type, as Python
+    # literals would otherwise promote the arithmetic to float64.
+    one, two, three = dtype(1), dtype(2), dtype(3)
+    dt_half = dtype(0.5) * dt
+    dt_sixth = dt / dtype(6)
+
+    for i in range(steps):
+        xi, yi, zi = x[i], y[i], z[i]
+
+        x2, y2, z2 = xi * xi, yi * yi, zi * zi
+        k1_x = ((zi - b) * xi) - (d * yi)
+        k1_y = (d * xi) + ((zi - b) * yi)
+        k1_z = c + (a * zi) - ((z2 * zi) / three) - ((x2 + y2) * (one + (e * zi))) + (f * zi * (x2 * xi))
+
+        xk, yk, zk = xi + (dt_half * k1_x), yi + (dt_half * k1_y), zi + (dt_half * k1_z)
+        x2, y2, z2 = xk * xk, yk * yk, zk * zk
+        k2_x = ((zk - b) * xk) - (d * yk)
+        k2_y = (d * xk) + ((zk - b) * yk)
+        k2_z = c + (a * zk) - ((z2 * zk) / three) - ((x2 + y2) * (one + (e * zk))) + (f * zk * (x2 * xk))
+
+        xk, yk, zk = xi + (dt_half * k2_x), yi + (dt_half * k2_y), zi + (dt_half * k2_z)
+        x2, y2, z2 = xk * xk, yk * yk, zk * zk
+        k3_x = ((zk - b) * xk) - (d * yk)
+        k3_y = (d * xk) + ((zk - b) * yk)
+        k3_z = c + (a * zk) - ((z2 * zk) / three) - ((x2 + y2) * (one + (e * zk))) + (f * zk * (x2 * xk))
+
+        xk, yk, zk = xi + (dt * k3_x), yi + (dt * k3_y), zi + (dt * k3_z)
+        x2, y2, z2 = xk * xk, yk * yk, zk * zk
+        k4_x = ((zk - b) * xk) - (d * yk)
+        k4_y = (d * xk) + ((zk - b) * yk)
+        k4_z = c + (a * zk) - ((z2 * zk) / three) - ((x2 + y2) * (one + (e * zk))) + (f * zk * (x2 * xk))
+
+        x[i + 1] = xi + (dt_sixth * (k1_x + (two * (k2_x + k3_x)) + k4_x))
+        y[i + 1] = yi + (dt_sixth * (k1_y + (two * (k2_y + k3_y)) + k4_y))
+        z[i + 1] = zi + (dt_sixth * (k1_z + (two * (k2_z + k3_z)) + k4_z))
+
+    data[3] = np.linspace(0, dt * steps, steps + 1)
+    return data
+
+
+@njit(cache=True, fastmath=True)
+def rk4_lorenz(beta, rho, sigma, x0, y0, z0, dt, steps, dtype):
+    """
+    Solves the ODE's (differential equations) for a Lorenz attractor
+    using the 4th order Runge-Kutta method, compiled with Numba.
+
+    Parameters
+    ----------
+    beta, rho, sigma : float
+        The parameters for the Lorenz attractor.
+    x0, y0, z0 : float
+        The initial cartesian coordinates of the strange attractor.
+    dt : float
+        The step size.
+    steps : int
+        The number of steps to use for the simulation.
+    dtype : type
+        The floating point type of the simulation, such as numpy.float32.
+        The parameters, initial coordinates and step size should
+        already be of this type.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The coordinates and time for the entire simulation, with shape
+        (4, steps + 1).
+    """
+
+    data = np.empty((4, steps + 1), dtype)
+    x, y, z = data[0], data[1], data[2]
+
+    x[0], y[0], z[0] = x0, y0, z0
+
+    # Build the constants with the floating point type, as Python
+    # literals would otherwise promote the arithmetic to float64.
+    two = dtype(2)
+    dt_half = dtype(0.5) * dt
+    dt_sixth = dt / dtype(6)
+
+    for i in range(steps):
+        xi, yi, zi = x[i], y[i], z[i]
+
+        k1_x = sigma * (yi - xi)
+        k1_y = (xi * (rho - zi)) - yi
+        k1_z = (xi * yi) - (beta * zi)
+
+        xk, yk, zk = xi + (dt_half * k1_x), yi + (dt_half * k1_y), zi + (dt_half * k1_z)
+        k2_x = sigma * (yk - xk)
+        k2_y = (xk * (rho - zk)) - yk
+        k2_z = (xk * yk) - (beta * zk)
+
+        xk, yk, zk = xi + (dt_half * k2_x), yi + (dt_half * k2_y), zi + (dt_half * k2_z)
+        k3_x = sigma * (yk - xk)
+        k3_y = (xk * (rho - zk)) - yk
+        k3_z = (xk * yk) - (beta * zk)
+
+        xk, yk, zk = xi + (dt * k3_x), yi + (dt * k3_y), zi + (dt * k3_z)
+        k4_x = sigma * (yk - xk)
+        k4_y = (xk * (rho - zk)) - yk
+        k4_z = (xk * yk) - (beta * zk)
+
+        x[i + 1] = xi + (dt_sixth * (k1_x + (two * (k2_x + k3_x)) + k4_x))
+        y[i + 1] = yi + (dt_sixth * (k1_y + (two * (k2_y + k3_y)) + k4_y))
+        z[i + 1] = zi + (dt_sixth * (k1_z + (two * (k2_z + k3_z)) + k4_z))
+
+    data[3] = np.linspace(0, dt * steps, steps + 1)
+    return data
+
+
+@njit(cache=True, fastmath=True)
+def rk4_rossler(a, b, c, x0, y0, z0, dt, steps, dtype):
+    """
+    Solves the ODE's (differential equations) for a Rossler attractor
+    using the 4th order Runge-Kutta method, compiled with Numba.
+
+    Parameters
+    ----------
+    a, b, c : float
+        The parameters for the Rossler attractor.
+    x0, y0, z0 : float
+        The initial cartesian coordinates of the strange attractor.
+    dt : float
+        The step size.
+    steps : int
+        The number of steps to use for the simulation.
+    dtype : type
+        The floating point type of the simulation, such as numpy.float32.
+        The parameters, initial coordinates and step size should
+        already be of this type.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The coordinates and time for the entire simulation, with shape
+        (4, steps + 1).
+    """
+
+    data = np.empty((4, steps + 1), dtype)
+    x, y, z = data[0], data[1], data[2]
+
+    x[0], y[0], z[0] = x0, y0, z0
+
+    # Build the constants with the floating point type, as Python
+    # literals would otherwise promote the arithmetic to float64.
+    two = dtype(2)
+    dt_half = dtype(0.5) * dt
+    dt_sixth = dt / dtype(6)
+
+    for i in range(steps):
+        xi, yi, zi = x[i], y[i], z[i]
+
+        k1_x = - yi - zi
+        k1_y = xi + (a * yi)
+        k1_z = b + (zi * (xi - c))
+
+        xk, yk, zk = xi + (dt_half * k1_x), yi + (dt_half * k1_y), zi + (dt_half * k1_z)
+        k2_x = - yk - zk
+        k2_y = xk + (a * yk)
+        k2_z = b + (zk * (xk - c))
+
+        xk, yk, zk = xi + (dt_half * k2_x), yi + (dt_half * k2_y), zi + (dt_half * k2_z)
+        k3_x = - yk - zk
+        k3_y = xk + (a * yk)
+        k3_z = b + (zk * (xk - c))
+
+        xk, yk, zk = xi + (dt * k3_x), yi + (dt * k3_y), zi + (dt * k3_z)
+        k4_x = - yk - zk
+        k4_y = xk + (a * yk)
+        k4_z = b + (zk * (xk - c))
+
+        x[i + 1] = xi + (dt_sixth * (k1_x + (two * (k2_x + k3_x)) + k4_x))
+        y[i + 1] = yi + (dt_sixth * (k1_y + (two * (k2_y + k3_y)) + k4_y))
+        z[i + 1] = zi + (dt_sixth * (k1_z + (two * (k2_z + k3_z)) + k4_z))
+
+    data[3] = np.linspace(0, dt * steps, steps + 1)
+    return data
+
+
+@njit(cache=True, fastmath=True)
+def rk4_sprott(a, b, x0, y0, z0, dt, steps, dtype):
+    """
+    Solves the ODE's (differential equations) for a Sprott attractor
+    using the 4th order Runge-Kutta method, compiled with Numba.
+
+    Parameters
+    ----------
+    a, b : float
+        The parameters for the Sprott attractor.
+    x0, y0, z0 : float
+        The initial cartesian coordinates of the strange attractor.
+    dt : float
+        The step size.
+    steps : int
+        The number of steps to use for the simulation.
+    dtype : type
+        The floating point type of the simulation, such as numpy.float32.
+        The parameters, initial coordinates and step size should
+        already be of this type.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The coordinates and time for the entire simulation, with shape
+        (4, steps + 1).
+    """
+
+    data = np.empty((4, steps + 1), dtype)
+    x, y, z = data[0], data[1], data[2]
+
+    x[0], y[0], z[0] = x0, y0, z0
+
+    # Build the constants with the floating point type, as Python
+    # literals would otherwise promote the arithmetic to float64.
+    one, two = dtype(1), dtype(2)
+    dt_half = dtype(0.5) * dt
+    dt_sixth = dt / dtype(6)
+
+    for i in range(steps):
+        xi, yi, zi = x[i], y[i], z[i]
+
+        x2 = xi * xi
+        k1_x = yi + (a * xi * yi) + (xi * zi)
+        k1_y = one - (b * x2) + (yi * zi)
+        k1_z = xi - x2 - (yi * yi)
+
+        xk, yk, zk = xi + (dt_half * k1_x), yi + (dt_half * k1_y), zi + (dt_half * k1_z)
+        x2 = xk * xk
+        k2_x = yk + (a * xk * yk) + (xk * zk)
+        k2_y = one - (b * x2) + (yk * zk)
+        k2_z = xk - x2 - (yk * yk)
+
+        xk, yk, zk = xi + (dt_half * k2_x), yi + (dt_half * k2_y), zi + (dt_half * k2_z)
+        x2 = xk * xk
+        k3_x = yk + (a * xk * yk) + (xk * zk)
+        k3_y = one - (b * x2) + (yk * zk)
+        k3_z = xk - x2 - (yk * yk)
+
+        xk, yk, zk = xi + (dt * k3_x), yi + (dt * k3_y), zi + (dt * k3_z)
+        x2 = xk * xk
+        k4_x = yk + (a * xk * yk) + (xk * zk)
+        k4_y = one - (b * x2) + (yk * zk)
+        k4_z = xk - x2 - (yk * yk)
+
+        x[i + 1] = xi + (dt_sixth * (k1_x + (two * (k2_x + k3_x)) + k4_x))
+        y[i + 1] = yi + (dt_sixth * (k1_y + (two * (k2_y + k3_y)) + k4_y))
+        z[i + 1] = zi + (dt_sixth * (k1_z + (two * (k2_z + k3_z)) + k4_z))
+
+    data[3] = np.linspace(0, dt * steps, steps + 1)
+    return data
+
+
+# Map each strange attractor to its compiled 4th order Runge-Kutta method.
+KERNELS = {
+    "langford": rk4_langford,
+    "lorenz": rk4_lorenz,
+    "rossler": rk4_rossler,
+    "sprott": rk4_sprott,
+}
@@ -1,3 +1,10 @@
+# Import external libraries.
+import numpy as np
+
+# Import local modules.
+from attractors._codegen import compile_step, literal
+
+
 class LangfordAttractor:
     """
     Represents a Langford attractor.
@@ -16,11 +23,11 @@ class LangfordAttractor:
         The e parameter for the Langford attractor.
     f : float
         The f parameter for the Langford attractor.
-    init_coords : list[float]
+    init_coords : numpy.ndarray
         The initial cartesian coordinates of the strange attractor.
     """
 
-    def __init__(self, a=0.95, b=0.7, c=0.6, d=3.5, e=0.25, f=0.1, init_coords = [0.1, 0.0, 0.0]):
+    def __init__(self, a=0.95, b=0.7, c=0.6, d=3.5, e=0.25, f=0.1, init_coords=None):
         """
         Constructs a LangfordAttractor object.
 
@@ -38,8 +45,9 @@ class LangfordAttractor:
             The e parameter for the Langford attractor.
         f : float
             The f parameter for the Langford attractor.
-        init_coords : list[float]
+        init_coords : list[float], optional
             The initial cartesian coordinates of the strange attractor.
+            Defaults to [0.1, 0.0, 0.0].
         """
 
         self.a = a
@@ -48,61 +56,104 @@ class LangfordAttractor:
         self.d = d
         self.e = e
         self.f = f
-        self.init_coords = init_coords
 
-    def dxdt(self, x, y, z, t):
+        if init_coords is None:
+            init_coords = [0.1, 0.0, 0.0]
+
+        self.init_coords = np.array(init_coords, dtype=np.float64)
+
+    def parameters(self):
         """
-        Returns the differential equation for dx/dt of the Langford
-        attractor.
+        Returns the parameters of the Langford attractor, in the order
+        expected by the compiled Runge-Kutta methods.
 
-        Parameters
-        ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
-        t : float
-            Time.
+        Returns
+        -------
+        tuple[float]
+            The a, b, c, d, e, f parameters.
+        """
+
+        return (self.a, self.b, self.c, self.d, self.e, self.f)
+
+    def rk4_step(self):
         """
+        Returns a single step of the 4th order Runge-Kutta method for the
+        Langford attractor, generated with its current parameters
+        substituted as literals. The generated step is cached, so it is
+        only compiled again when the parameters change.
 
-        return ((z - self.b) * x) - (self.d * y)
+        Returns
+        -------
+        function
+            The function step(x, y, z, dt), which returns the cartesian
+            coordinates after one step.
+        """
+
+        a, b, c, d, e, f = self.parameters()
+
+        return compile_step("langford", f"""
+            x2, y2, z2 = x * x, y * y, z * z
+            dx = ((z - {literal(b)}) * x) - ({literal(d)} * y)
+            dy = ({literal(d)} * x) + ((z - {literal(b)}) * y)
+            dz = {literal(c)} + ({literal(a)} * z) - ((z2 * z) / 3) - ((x2 + y2) * (1 + ({literal(e)} * z))) + ({literal(f)} * z * (x2 * x))
+        """)
 
-    def dydt(self, x, y, z, t):
+    def deriv(self, state):
         """
-        Returns the differential equation for dy/dt of the Langford
-        attractor.
+        Returns the derivatives of the Langford attractor as a single
+        state vector.
 
         Parameters
         ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
-        t : float
-            Time.
+        state : numpy.ndarray
+            The x, y and z cartesian coordinates, with shape (3,) or
+            (N, 3) for N trajectories.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of dx/dt, dy/dt and dz/dt, with the same shape
+            as the state.
         """
 
-        return (self.d * x) + ((z - self.b) * y)
+        a, b, c, d, e, f = self.a, self.b, self.c, self.d, self.e, self.f
+
+        # A single trajectory is unpacked to floats, as NumPy operations
+        # on three element arrays cost more than the arithmetic itself.
+        if state.ndim == 1:
+            x, y, z = state.tolist()
+        else:
+            x, y, z = state[..., 0], state[..., 1], state[..., 2]
 
-    def dzdt(self, x, y, z, t):
+        x2, y2, z2 = x * x, y * y, z * z
+
+        derivs = [
+            ((z - b) * x) - (d * y),
+            (d * x) + ((z - b) * y),
+            c + (a * z) - ((z2 * z) / 3) - ((x2 + y2) * (1 + (e * z))) + (f * z * (x2 * x)),
+        ]
+
+        if state.ndim == 1:
+            return np.array(derivs, dtype=state.dtype)
+
+        return np.stack(derivs, axis=-1)
+
+    def rhs(self, t, state):
         """
-        Returns the differential equation for dz/dt of the Langford
-        attractor.
+        Returns the derivatives of the Langford attractor, with the
+        argument order expected by scipy.integrate.solve_ivp.
 
         Parameters
         ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
         t : float
-            Time.
+            Time, which is unused as the strange attractor is autonomous.
+        state : numpy.ndarray
+            The x, y and z cartesian coordinates.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of dx/dt, dy/dt and dz/dt.
         """
 
-        return self.c + (self.a * z) - ((z ** 3) / 3) - (((x ** 2) + (y ** 2)) * (1 + (self.e * z))) + (self.f * z * (x ** 3))
+        return self.deriv(state)
@@ -1,3 +1,10 @@
+# Import external libraries.
+import numpy as np
+
+# Import local modules.
+from attractors._codegen import compile_step, literal
+
+
 class LorenzAttractor:
     """
     Represents a Lorenz attractor.
@@ -10,11 +17,11 @@ class LorenzAttractor:
         The rho parameter for the Lorenz attractor.
     sigma : float
         The sigma parameter for the Lorenz attractor.
-    init_coords : list[float]
+    init_coords : numpy.ndarray
         The initial cartesian coordinates of the strange attractor.
     """
 
-    def __init__(self, beta=8/3, rho=28.0, sigma=10.0, init_coords=[0.1, 0.1, 0.1]):
+    def __init__(self, beta=8/3, rho=28.0, sigma=10.0, init_coords=None):
         """
         Constructs a LorenzAttractor object.
 
@@ -26,67 +33,109 @@ class LorenzAttractor:
             The rho parameter for the Lorenz attractor.
         sigma : float
             The sigma parameter for the Lorenz attractor.
-        init_coords : list[float]
+        init_coords : list[float], optional
             The initial cartesian coordinates of the strange attractor.
+            Defaults to [0.1, 0.1, 0.1].
         """
 
         self.beta = beta
         self.rho = rho
         self.sigma = sigma
-        self.init_coords = init_coords
 
-    def dxdt(self, x, y, z, t):
+        if init_coords is None:
+            init_coords = [0.1, 0.1, 0.1]
+
+        self.init_coords = np.array(init_coords, dtype=np.float64)
+
+    def parameters(self):
         """
-        Returns the differential equation for dx/dt of the Lorenz
-        attractor.
+        Returns the parameters of the Lorenz attractor, in the order
+        expected by the compiled Runge-Kutta methods.
 
-        Parameters
-        ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
-        t : float
-            Time.
+        Returns
+        -------
+        tuple[float]
+            The beta, rho, sigma parameters.
+        """
+
+        return (self.beta, self.rho, self.sigma)
+
+    def rk4_step(self):
         """
+        Returns a single step of the 4th order Runge-Kutta method for the
+        Lorenz attractor, generated with its current parameters
+        substituted as literals. The generated step is cached, so it is
+        only compiled again when the parameters change.
 
-        return (self.sigma * (y - x))
+        Returns
+        -------
+        function
+            The function step(x, y, z, dt), which returns the cartesian
+            coordinates after one step.
+        """
+
+        beta, rho, sigma = self.parameters()
+
+        return compile_step("lorenz", f"""
+            dx = {literal(sigma)} * (y - x)
+            dy = (x * ({literal(rho)} - z)) - y
+            dz = (x * y) - ({literal(beta)} * z)
+        """)
 
-    def dydt(self, x, y, z, t):
+    def deriv(self, state):
         """
-        Returns the differential equation for dy/dt of the Lorenz
-        attractor.
+        Returns the derivatives of the Lorenz attractor as a single
+        state vector.
 
         Parameters
         ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
-        t : float
-            Time.
+        state : numpy.ndarray
+            The x, y and z cartesian coordinates, with shape (3,) or
+            (N, 3) for N trajectories.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of dx/dt, dy/dt and dz/dt, with the same shape
+            as the state.
         """
 
-        return ((x * (self.rho - z)) - y)
+        beta, rho, sigma = self.beta, self.rho, self.sigma
+
+        # A single trajectory is unpacked to floats, as NumPy operations
+        # on three element arrays cost more than the arithmetic itself.
+        if state.ndim == 1:
+            x, y, z = state.tolist()
+        else:
+            x, y, z = state[..., 0], state[..., 1], state[..., 2]
 
-    def dzdt(self, x, y, z, t):
+        derivs = [
+            sigma * (y - x),
+            (x * (rho - z)) - y,
+            (x * y) - (beta * z),
+        ]
+
+        if state.ndim == 1:
+            return np.array(derivs, dtype=state.dtype)
+
+        return np.stack(derivs, axis=-1)
+
+    def rhs(self, t, state):
         """
-        Returns the differential equation for dz/dt of the Lorenz
-        attractor.
+        Returns the derivatives of the Lorenz attractor, with the
+        argument order expected by scipy.integrate.solve_ivp.
 
         Parameters
         ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
         t : float
-            Time.
+            Time, which is unused as the strange attractor is autonomous.
+        state : numpy.ndarray
+            The x, y and z cartesian coordinates.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of dx/dt, dy/dt and dz/dt.
         """
-        return ((x * y) - (self.beta * z))
+
+        return self.deriv(state)
@@ -1,3 +1,10 @@
+# Import external libraries.
+import numpy as np
+
+# Import local modules.
+from attractors._codegen import compile_step, literal
+
+
 class RosslerAttractor:
     """
     Represents a Rossler attractor.
@@ -10,11 +17,11 @@ class RosslerAttractor:
         The b parameter for the Rossler attractor.
     c : float
         The c parameter for the Rossler attractor.
-    init_coords : list[float]
+    init_coords : numpy.ndarray
         The initial cartesian coordinates of the strange attractor.
     """
 
-    def __init__(self, a=0.2, b=0.2, c=5.7, init_coords=[0.1, 0.0, -0.1]):
+    def __init__(self, a=0.2, b=0.2, c=5.7, init_coords=None):
         """
         Constructs a RosslerAttractor object.
 
@@ -26,68 +33,109 @@ class RosslerAttractor:
             The v parameter for the Rossler attractor.
         c : float
             The c parameter for the Rossler attractor.
-        init_coords : list[float]
+        init_coords : list[float], optional
             The initial cartesian coordinates of the strange attractor.
+            Defaults to [0.1, 0.0, -0.1].
         """
 
         self.a = a
         self.b = b
         self.c = c
-        self.init_coords = init_coords
 
-    def dxdt(self, x, y, z, t):
+        if init_coords is None:
+            init_coords = [0.1, 0.0, -0.1]
+
+        self.init_coords = np.array(init_coords, dtype=np.float64)
+
+    def parameters(self):
         """
-        Returns the differential equation for dx/dt of the Rossler
-        attractor.
+        Returns the parameters of the Rossler attractor, in the order
+        expected by the compiled Runge-Kutta methods.
 
-        Parameters
-        ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
-        t : float
-            Time.
+        Returns
+        -------
+        tuple[float]
+            The a, b, c parameters.
         """
 
-        return - y - z
+        return (self.a, self.b, self.c)
 
-    def dydt(self, x, y, z, t):
+    def rk4_step(self):
         """
-        Returns the differential equation for dy/dt of the Rossler
-        attractor.
+        Returns a single step of the 4th order Runge-Kutta method for the
+        Rossler attractor, generated with its current parameters
+        substituted as literals. The generated step is cached, so it is
+        only compiled again when the parameters change.
+
+        Returns
+        -------
+        function
+            The function step(x, y, z, dt), which returns the cartesian
+            coordinates after one step.
+        """
+
+        a, b, c = self.parameters()
+
+        return compile_step("rossler", f"""
+            dx = - y - z
+            dy = x + ({literal(a)} * y)
+            dz = {literal(b)} + (z * (x - {literal(c)}))
+        """)
+
+    def deriv(self, state):
+        """
+        Returns the derivatives of the Rossler attractor as a single
+        state vector.
 
         Parameters
         ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
-        t : float
-            Time.
+        state : numpy.ndarray
+            The x, y and z cartesian coordinates, with shape (3,) or
+            (N, 3) for N trajectories.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of dx/dt, dy/dt and dz/dt, with the same shape
+            as the state.
         """
 
-        return x + (self.a * y)
+        a, b, c = self.a, self.b, self.c
 
-    def dzdt(self, x, y, z, t):
+        # A single trajectory is unpacked to floats, as NumPy operations
+        # on three element arrays cost more than the arithmetic itself.
+        if state.ndim == 1:
+            x, y, z = state.tolist()
+        else:
+            x, y, z = state[..., 0], state[..., 1], state[..., 2]
+
+        derivs = [
+            - y - z,
+            x + (a * y),
+            b + (z * (x - c)),
+        ]
+
+        if state.ndim == 1:
+            return np.array(derivs, dtype=state.dtype)
+
+        return np.stack(derivs, axis=-1)
+
+    def rhs(self, t, state):
         """
-        Returns the differential equation for dz/dt of the Rossler
-        attractor.
+        Returns the derivatives of the Rossler attractor, with the
+        argument order expected by scipy.integrate.solve_ivp.
 
         Parameters
         ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
         t : float
-            Time.
+            Time, which is unused as the strange attractor is autonomous.
+        state : numpy.ndarray
+            The x, y and z cartesian coordinates.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of dx/dt, dy/dt and dz/dt.
         """
 
-        return self.b + (z * (x - self.c))
+        return self.deriv(state)
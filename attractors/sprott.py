@@ -1,3 +1,10 @@
+# Import external libraries.
+import numpy as np
+
+# Import local modules.
+from attractors._codegen import compile_step, literal
+
+
 class SprottAttractor:
     """
     Represents a Sprott attractor.
@@ -8,11 +15,11 @@ class SprottAttractor:
         The a parameter for the Sprott attractor.
     b : float
         The b parameter for the Sprott attractor.
-    init_coords : list[float]
+    init_coords : numpy.ndarray
         The initial cartesian coordinates of the strange attractor.
     """
 
-    def __init__(self, a=2.07, b=1.79, init_coords=[0.1, 0.0, 0.0]):
+    def __init__(self, a=2.07, b=1.79, init_coords=None):
         """
         Constructs a SprottAttractor object.
         Parameters
@@ -21,67 +28,111 @@ class SprottAttractor:
             The a parameter for the Sprott attractor.
         b : float
             The b parameter for the Sprott attractor.
-        init_coords : list[float]
+        init_coords : list[float], optional
             The initial cartesian coordinates of the strange attractor.
+            Defaults to [0.1, 0.0, 0.0].
         """
 
         self.a = a
         self.b = b
-        self.init_coords = init_coords
 
-    def dxdt(self, x, y, z, t):
+        if init_coords is None:
+            init_coords = [0.1, 0.0, 0.0]
+
+        self.init_coords = np.array(init_coords, dtype=np.float64)
+
+    def parameters(self):
         """
-        Returns the differential equation for dx/dt of the Sprott
-        attractor.
+        Returns the parameters of the Sprott attractor, in the order
+        expected by the compiled Runge-Kutta methods.
 
-        Parameters
-        ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
-        t : float
-            Time.
+        Returns
+        -------
+        tuple[float]
+            The a, b parameters.
+        """
+
+        return (self.a, self.b)
+
+    def rk4_step(self):
         """
+        Returns a single step of the 4th order Runge-Kutta method for the
+        Sprott attractor, generated with its current parameters
+        substituted as literals. The generated step is cached, so it is
+        only compiled again when the parameters change.
 
-        return y + (self.a * x * y) + (x * z)
+        Returns
+        -------
+        function
+            The function step(x, y, z, dt), which returns the cartesian
+            coordinates after one step.
+        """
+
+        a, b = self.parameters()
+
+        return compile_step("sprott", f"""
+            x2 = x * x
+            dx = y + ({literal(a)} * x * y) + (x * z)
+            dy = 1 - ({literal(b)} * x2) + (y * z)
+            dz = x - x2 - (y * y)
+        """)
 
-    def dydt(self, x, y, z, t):
+    def deriv(self, state):
         """
-        Returns the differential equation for dy/dt of the Sprott
-        attractor.
+        Returns the derivatives of the Sprott attractor as a single
+        state vector.
 
         Parameters
         ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
-        t : float
-            Time.
+        state : numpy.ndarray
+            The x, y and z cartesian coordinates, with shape (3,) or
+            (N, 3) for N trajectories.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of dx/dt, dy/dt and dz/dt, with the same shape
+            as the state.
         """
 
-        return 1 - (self.b * (x ** 2)) + (y * z)
+        a, b = self.a, self.b
+
+        # A single trajectory is unpacked to floats, as NumPy operations
+        # on three element arrays cost more than the arithmetic itself.
+        if state.ndim == 1:
+            x, y, z = state.tolist()
+        else:
+            x, y, z = state[..., 0], state[..., 1], state[..., 2]
 
-    def dzdt(self, x, y, z, t):
+        x2 = x * x
+
+        derivs = [
+            y + (a * x * y) + (x * z),
+            1 - (b * x2) + (y * z),
+            x - x2 - (y * y),
+        ]
+
+        if state.ndim == 1:
+            return np.array(derivs, dtype=state.dtype)
+
+        return np.stack(derivs, axis=-1)
+
+    def rhs(self, t, state):
         """
-        Returns the differential equation for dz/dt of the Sprott
-        attractor.
+        Returns the derivatives of the Sprott attractor, with the
+        argument order expected by scipy.integrate.solve_ivp.
 
         Parameters
         ----------
-        x : float
-            The x cartesian coordinate.
-        y : float
-            The y cartesian coordinate.
-        z : float
-            The z cartesian coordinate.
         t : float
-            Time.
+            Time, which is unused as the strange attractor is autonomous.
+        state : numpy.ndarray
+            The x, y and z cartesian coordinates.
+
+        Returns
+        -------
+        numpy.ndarray
+            The values of dx/dt, dy/dt and dz/dt.
         """
 
-        return x - (x ** 2) - (y ** 2)
+        return self.deriv(state)
@@ -1,10 +1,13 @@
 # Import standard libraries.
 import argparse
+import inspect
 
 # Import external libraries.
-from matplotlib.animation import FuncAnimation
+from joblib import Parallel, delayed
+from matplotlib.animation import FFMpegWriter, FuncAnimation, PillowWriter
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.integrate import solve_ivp
 
 # Import local modules.
 from attractors.langford import LangfordAttractor
@@ -12,23 +15,72 @@ from attractors.lorenz import LorenzAttractor
 from attractors.rossler import RosslerAttractor
 from attractors.sprott import SprottAttractor
 
+# Import optional modules.
+try:
+    from attractors import _rk4_numba
+except ImportError:
+    _rk4_numba = None
+
+try:
+    from attractors import _rk4 as _rk4_cython
+except ImportError:
+    _rk4_cython = None
+
+# The number of simulation steps per second of simulation time for each
+# output format, and the frame rate of animations.
+_STEPS_PER_SECOND = {"animation": 50, "image": 100}
+_FPS = 30
+
+# Map each strange attractor to the class which represents it.
+_ATTRACTOR_MAP = {
+    "langford": LangfordAttractor,
+    "lorenz": LorenzAttractor,
+    "rossler": RosslerAttractor,
+    "sprott": SprottAttractor,
+}
+
 
 def main():
     # Configure the simulation with command line arguments.
     args = arguments()
-    valid(args.output, args.time)
+    fmt = args.format
+    if fmt is None:
+        fmt = "png" if args.output == "image" else ("mp4" if FFMpegWriter.isAvailable() else "gif")
+
+    valid(args.output, args.time, fmt)
+
+    if args.sweep:
+        valid_sweep(args.attractor, args.sweep, args.solver)
+
+    # Check FFmpeg is available before any work is done, as the animation
+    # is only written once the simulation has finished.
+    if fmt == "mp4" and not FFMpegWriter.isAvailable():
+        raise RuntimeError("ffmpeg not available, use the gif format")
 
     # Simulate the strange attractor.
     steps = calc_steps(args.output, args.time)
-    attractor = get_attractor(args.attractor)
-    data = runge_kutta_four(attractor.dxdt, attractor.dydt, attractor.dzdt, args.time, steps, attractor.init_coords)
+
+    # Animations only need visual precision, so are simulated in single
+    # precision.
+    dtype = np.float32 if args.output == "animation" else np.float64
+
+    if args.sweep:
+        param, *values = args.sweep
+        param_grid = [{param: float(value)} for value in values]
+        data = sweep(args.attractor, param_grid, args.time, steps, dtype)
+
+    elif args.solver == "adaptive":
+        data = solve_adaptive(args.attractor, get_attractor(args.attractor), args.time, steps)
+
+    else:
+        data = simulate(args.attractor, get_attractor(args.attractor), args.time, steps, dtype)
 
     # Visualise the simulation.
     if args.output == "image":
-        plot(args.attractor, data)
+        plot(args.attractor, data, fmt)
 
     else:
-        animate(args.attractor, data, steps)
+        animate(args.attractor, data, steps, fmt)
 
 
 def arguments():
@@ -44,32 +96,47 @@ def arguments():
                 {animation, image}.
     time      : The total time of the simulation.
                 Max time for animation = 60, image = 600.
+    solver    : The method used to solve the ODE's (optional).
+                {adaptive, rk4}, default = rk4.
+    format    : The file format of the output (optional).
+                Animation = {gif, mp4}, default = mp4, or gif if
+                FFmpeg is not available.
+                Image = {png, svg}, default = png.
+    sweep     : A parameter of the strange attractor followed by the
+                values to simulate it with, in parallel (optional).
+                For example, rho 20 24 28.
 
     Returns
     -------
     object argparse.Namespace
-        Contains the attractor, output and time arguments.
+        Contains the attractor, output, time, solver, format and sweep
+        arguments.
     """
 
     parser = argparse.ArgumentParser()
 
-    strange_attractors = ["langford", "lorenz", "rossler", "sprott"]
+    strange_attractors = list(_ATTRACTOR_MAP)
 
     parser.add_argument("attractor", choices=strange_attractors, type=str.lower, help="strange attractor to be simulated")
     parser.add_argument("output", choices=["animation", "image"], type=str.lower, help="output format of simulation")
     parser.add_argument("time", type=int, help="total time of simulation {animation : 1-60, image : 1-600}")
+    parser.add_argument("--solver", choices=["adaptive", "rk4"], default="rk4", type=str.lower, help="method used to solve the ODE's")
+    parser.add_argument("--format", choices=["gif", "mp4", "png", "svg"], type=str.lower, help="file format of output {animation : gif, mp4, image : png, svg}")
+    parser.add_argument("--sweep", nargs="+", metavar=("PARAM", "VALUE"), help="parameter of strange attractor and values to simulate it with")
 
     return parser.parse_args()
 
 
-def valid(output, time):
+def valid(output, time, fmt=None):
     """
-    Validates the "time" argument for the simulation.
+    Validates the "time" and "format" arguments for the simulation.
 
     The simulation time should be a positive integer. If the output
     format is "animation", the maximum allowed time is 60 seconds.
     If the output format is "image", the maximum allowed time is 600
-    seconds. All of these conditions are checked.
+    seconds. The file format, if given, should be "gif" or "mp4" for
+    an animation and "png" or "svg" for an image. All of these
+    conditions are checked.
 
     Parameters
     ----------
@@ -77,16 +144,18 @@ def valid(output, time):
         The output format of the simulation.
     time   : int
         The total time of the simulation.
+    fmt    : str
+        The file format of the output.
 
     Returns
     -------
     bool True
-        If the "time" argument is valid.
+        If the "time" and "format" arguments are valid.
 
     Raises
     ------
     error ValueError
-        If the "time" argument is invalid.
+        If the "time" or "format" argument is invalid.
     """
 
     if time < 1:
@@ -98,6 +167,61 @@ def valid(output, time):
     elif output == "animation" and time > 60:
         raise ValueError("simulation time too long for animation")
 
+    elif output == "image" and fmt not in (None, "png", "svg"):
+        raise ValueError("invalid file format for image")
+
+    elif output == "animation" and fmt not in (None, "gif", "mp4"):
+        raise ValueError("invalid file format for animation")
+
+    return True
+
+
+def valid_sweep(attractor, sweep, solver):
+    """
+    Validates the "sweep" argument for the simulation.
+
+    The first value should be the name of a parameter of the strange
+    attractor, followed by at least one numeric value for it. A sweep
+    is only supported by the "rk4" solver. All of these conditions are
+    checked.
+
+    Parameters
+    ----------
+    attractor : str
+        The strange attractor that is being simulated.
+    sweep  : list[str]
+        The parameter of the strange attractor followed by its values.
+    solver : str
+        The method used to solve the ODE's.
+
+    Returns
+    -------
+    bool True
+        If the "sweep" argument is valid.
+
+    Raises
+    ------
+    error ValueError
+        If the "sweep" argument is invalid, or the solver is not "rk4".
+    """
+
+    param, *values = sweep
+    attractor_params = inspect.signature(_ATTRACTOR_MAP[attractor]).parameters
+
+    if solver != "rk4":
+        raise ValueError("parameter sweep requires the rk4 solver")
+
+    elif param == "init_coords" or param not in attractor_params:
+        raise ValueError("invalid attractor parameter")
+
+    elif not values:
+        raise ValueError("no values for parameter sweep")
+
+    try:
+        [float(value) for value in values]
+    except ValueError:
+        raise ValueError("invalid parameter value") from None
+
     return True
 
 
@@ -105,9 +229,11 @@ def calc_steps(output, time):
     """
     Calculates the number of steps to use in the simulation.
 
-    A step size of 0.02 is used for a simulation with output format
-    "animation". A step size of 0.01 is used for a simulation with
-    output format "image".
+    A step size of 0.02 (50 steps per second) is used for a simulation
+    with output format "animation". A step size of 0.01 (100 steps per
+    second) is used for a simulation with output format "image". The
+    number of steps is calculated with integer arithmetic, so it is
+    exact for any simulation time.
 
     Parameters
     ----------
@@ -121,11 +247,10 @@ def calc_steps(output, time):
         The number of steps to use in the simulation.
     """
 
-    step = 0.01 if output == "image" else 0.02
-    return int(time / step)
+    return time * _STEPS_PER_SECOND[output]
 
 
-def get_attractor(attractor):
+def get_attractor(attractor, **kwargs):
     """
     Returns an object of the class corresponding to the strange
     attractor that is being simulated.
@@ -134,6 +259,9 @@ def get_attractor(attractor):
     ----------
     attractor : str
         The strange attractor that is being simulated.
+    **kwargs
+        The parameters and initial coordinates to construct the object
+        with, such as rho for the Lorenz attractor.
 
     Returns
     -------
@@ -150,115 +278,271 @@ def get_attractor(attractor):
     ------
     error ValueError
         If an object corresponding to the strange attractor could not
-        be found.
+        be found, or if it has no parameter with one of the given names.
+    """
+
+    try:
+        attractor_cls = _ATTRACTOR_MAP[attractor]
+    except KeyError:
+        raise ValueError("attractor not found") from None
+
+    attractor_params = inspect.signature(attractor_cls).parameters
+
+    if any(name not in attractor_params for name in kwargs):
+        raise ValueError("invalid attractor parameter")
+
+    return attractor_cls(**kwargs)
+
+
+def simulate(name, attractor, time, steps, dtype=np.float64):
+    """
+    Simulates the strange attractor using the fastest available
+    implementation of the 4th order Runge-Kutta method.
+
+    If a single trajectory is being simulated, the compiled method for
+    the strange attractor is used, preferring Numba over the Cython
+    extension. If neither is available, the step generated for the
+    strange attractor is used with the "runge_kutta_four_specialised"
+    function. Batches of trajectories use the "runge_kutta_four"
+    function.
+
+    Parameters
+    ----------
+    name : str
+        The strange attractor that is being simulated.
+    attractor : object
+        The object representing the strange attractor.
+    time  : int
+        The total time of the simulation.
+    steps : int
+        The number of steps to use for the simulation.
+    dtype : type
+        The floating point type of the simulation, either numpy.float32
+        or numpy.float64.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The data containing the coordinates for the entire simulation of
+        the strange attractor.
+    """
+
+    if np.ndim(attractor.init_coords) == 1:
+        if _rk4_numba is not None:
+            kernel = _rk4_numba.KERNELS[name]
+            params = [dtype(param) for param in attractor.parameters()]
+            init_coords = [dtype(coord) for coord in attractor.init_coords]
+            return kernel(*params, *init_coords, dtype(time/steps), steps, dtype)
+
+        if _rk4_cython is not None:
+            kernel = _rk4_cython.KERNELS[name]
+            data = kernel(*attractor.parameters(), attractor.init_coords, time/steps, steps)
+            return data.astype(dtype, copy=False)
+
+        return runge_kutta_four_specialised(attractor.rk4_step(), time, steps, attractor.init_coords, dtype)
+
+    return runge_kutta_four(attractor.deriv, time, steps, attractor.init_coords, dtype)
+
+
+def sweep(name, param_grid, time, steps, dtype=np.float64):
+    """
+    Simulates the strange attractor once for each set of parameters,
+    with the simulations run in parallel across all CPU cores.
+
+    Each simulation is independent, so each worker constructs its own
+    strange attractor and integrates it with the "simulate" function.
+
+    Parameters
+    ----------
+    name : str
+        The strange attractor that is being simulated.
+    param_grid : list[dict]
+        The parameters to construct the strange attractor with, for each
+        simulation.
+    time  : int
+        The total time of each simulation.
+    steps : int
+        The number of steps to use for each simulation.
+    dtype : type
+        The floating point type of the simulations, either numpy.float32
+        or numpy.float64.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The data containing the coordinates for every simulation of the
+        strange attractor, with shape (N, 4, steps + 1) for N sets of
+        parameters.
+
+    Raises
+    ------
+    error ValueError
+        If there are no sets of parameters to simulate.
     """
 
-    match attractor:
-        case "langford":
-            return LangfordAttractor()
-        case "lorenz":
-            return LorenzAttractor()
-        case "rossler":
-            return RosslerAttractor()
-        case "sprott":
-            return SprottAttractor()
-        case _:
-            raise ValueError("attractor not found")
+    if not param_grid:
+        raise ValueError("no parameters to sweep")
+
+    def run(params):
+        return simulate(name, get_attractor(name, **params), time, steps, dtype)
 
+    results = Parallel(n_jobs=-1, backend="loky")(delayed(run)(params) for params in param_grid)
+    return np.stack(results)
 
-def runge_kutta_four(dxdt, dydt, dzdt, time, steps, init_coords):
+
+def runge_kutta_four(deriv, time, steps, init_coords, dtype=np.float64):
     """
     Solves the ODES's (differential equations) for the strange attractor
     that is being simulated using the 4th order Runge-Kutta method.
 
     Parameters
     ----------
-    dxdt : function
-        The function which returns the differential equation for dx/dt
-        of the strange attractor.
-    dydt : function
-        The function which returns the differential equation for dy/dt
-        of the strange attractor.
-    dzdt : function
-        The function which returns the differential equation for dz/dt
-        of the strange attractor.
+    deriv : function
+        The function which returns the differential equations dx/dt,
+        dy/dt and dz/dt of the strange attractor as a single vector.
+        The strange attractors are autonomous, so it is not passed the
+        time.
+    time  : int
+        The total time of the simulation.
+    steps : int
+        The number of steps to use for the simulation.
+    init_coords : list[float] | numpy.ndarray
+        The initial cartesian coordinates of the strange attractor, with
+        shape (3,) or (N, 3) to simulate N trajectories at once.
+    dtype : type
+        The floating point type of the simulation, either numpy.float32
+        or numpy.float64.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The data containing the coordinates for the entire simulation of
+        the strange attractor, with shape (4, steps + 1) or
+        (N, 4, steps + 1) for N trajectories.
+    """
+
+    init_coords = np.asarray(init_coords, dtype=dtype)
+
+    # Initialise the array for the data of every trajectory, and a view
+    # of it for the state (cartesian coordinates) at each step.
+    data = np.empty(init_coords.shape[:-1] + (4, steps + 1), dtype=dtype)
+    state = data[..., :3, :]
+
+    # Calculate the step size, and the fractions of it used by each stage.
+    dt = time/steps
+    dt_half = 0.5 * dt
+    dt_sixth = dt / 6
+
+    # Set the initial coordinates. The current state is kept in a local
+    # variable, so each step only writes to the array once.
+    state[..., 0] = init_coords
+    s = init_coords
+
+    # Perform the 4th order Runge-Kutta method.
+    for i in range(1, steps + 1):
+        k1 = deriv(s)
+        k2 = deriv(s + (dt_half * k1))
+        k3 = deriv(s + (dt_half * k2))
+        k4 = deriv(s + (dt * k3))
+
+        # Update the cartesian coordinates of the simulation.
+        s = s + (dt_sixth * (k1 + (2 * (k2 + k3)) + k4))
+        state[..., i] = s
+
+    # Return the data for the entire simulation.
+    data[..., 3, :] = np.linspace(0, time, steps + 1, dtype=dtype)
+
+    return data
+
+
+def runge_kutta_four_specialised(step, time, steps, init_coords, dtype=np.float64):
+    """
+    Solves the ODE's (differential equations) for the strange attractor
+    that is being simulated using the 4th order Runge-Kutta method, with
+    a step function generated for the strange attractor.
+
+    Parameters
+    ----------
+    step : function
+        The function which performs a single step of the 4th order
+        Runge-Kutta method for the strange attractor, with its
+        parameters substituted as literals.
     time  : int
         The total time of the simulation.
     steps : int
         The number of steps to use for the simulation.
-    init_coords : list[float]
+    init_coords : list[float] | numpy.ndarray
         The initial cartesian coordinates of the strange attractor.
+    dtype : type
+        The floating point type of the simulation data, either
+        numpy.float32 or numpy.float64.
 
     Returns
     -------
     data : numpy.ndarray
         The data containing the coordinates for the entire simulation of
-        the strange attractor.
+        the strange attractor, with shape (4, steps + 1).
     """
 
-    # Initialise arrays for each of the cartesian coordinates and time.
-    x = np.zeros(steps + 1)
-    y = np.zeros(steps + 1)
-    z = np.zeros(steps + 1)
-    t = np.zeros(steps + 1)
+    data = np.empty((4, steps + 1), dtype=dtype)
+    xs, ys, zs = data[0], data[1], data[2]
 
     # Calculate the step size.
     dt = time/steps
 
-    # Set the initial coordinates.
-    x[0] = init_coords[0]
-    y[0] = init_coords[1]
-    z[0] = init_coords[2]
+    # Set the initial coordinates, which are kept as Python floats for
+    # the generated step function.
+    x, y, z = (float(coord) for coord in init_coords)
+    xs[0], ys[0], zs[0] = x, y, z
 
     # Perform the 4th order Runge-Kutta method.
-    for i in range(steps):
-
-        # 1st order calculations.
-        k1_x = dxdt(x[i], y[i], z[i], t[i])
-        k1_y = dydt(x[i], y[i], z[i], t[i])
-        k1_z = dzdt(x[i], y[i], z[i], t[i])
-
-        # 2nd order calculations.
-        x_k2 = x[i] + (0.5 * k1_x * dt)
-        y_k2 = y[i] + (0.5 * k1_y * dt)
-        z_k2 = z[i] + (0.5 * k1_z * dt)
-        t_k2 = t[i] + (0.5 * dt)
-
-        k2_x = dxdt(x_k2, y_k2, z_k2, t_k2)
-        k2_y = dydt(x_k2, y_k2, z_k2, t_k2)
-        k2_z = dzdt(x_k2, y_k2, z_k2, t_k2)
-
-        # 3rd order calculations.
-        x_k3 = x[i] + (0.5 * k2_x * dt)
-        y_k3 = y[i] + (0.5 * k2_y * dt)
-        z_k3 = z[i] + (0.5 * k2_z * dt)
-        t_k3 = t[i] + (0.5 * dt)
-
-        k3_x = dxdt(x_k3, y_k3, z_k3, t_k3)
-        k3_y = dydt(x_k3, y_k3, z_k3, t_k3)
-        k3_z = dzdt(x_k3, y_k3, z_k3, t_k3)
-
-        # 4th order calculations.
-        x_k4 = x[i] + (k3_x * dt)
-        y_k4 = y[i] + (k3_y * dt)
-        z_k4 = z[i] + (k3_z * dt)
-        t_k4 = t[i] + dt
-
-        k4_x = dxdt(x_k4, y_k4, z_k4, t_k4)
-        k4_y = dydt(x_k4, y_k4, z_k4, t_k4)
-        k4_z = dzdt(x_k4, y_k4, z_k4, t_k4)
-
-        # Update the cartesian coordinates and time of the simulation.
-        x[i + 1] = x[i] + ((dt * (k1_x + (2 * k2_x) + (2 * k3_x) + k4_x)) / 6)
-        y[i + 1] = y[i] + ((dt * (k1_y + (2 * k2_y) + (2 * k3_y) + k4_y)) / 6)
-        z[i + 1] = z[i] + ((dt * (k1_z + (2 * k2_z) + (2 * k3_z) + k4_z)) / 6)
-        t[i + 1] = t[i] + dt
+    for i in range(1, steps + 1):
+        x, y, z = step(x, y, z, dt)
+        xs[i], ys[i], zs[i] = x, y, z
 
     # Return the data for the entire simulation.
-    return np.array([x, y, z, t])
+    data[3] = np.linspace(0, time, steps + 1, dtype=dtype)
+
+    return data
+
+
+def solve_adaptive(name, attractor, time, steps):
+    """
+    Solves the ODE's (differential equations) for the strange attractor
+    that is being simulated using an adaptive step size solver.
+
+    The DOP853 method is used for all strange attractors except the
+    Sprott attractor, which can grow rapidly and uses the LSODA method.
+    The dense output of the solver is sampled at the same times as the
+    4th order Runge-Kutta method, so the data can be visualised in the
+    same way.
+
+    Parameters
+    ----------
+    name : str
+        The strange attractor that is being simulated.
+    attractor : object
+        The object representing the strange attractor.
+    time  : int
+        The total time of the simulation.
+    steps : int
+        The number of points to sample from the solution.
+
+    Returns
+    -------
+    data : numpy.ndarray
+        The data containing the coordinates for the entire simulation of
+        the strange attractor.
+    """
+
+    method = "LSODA" if name == "sprott" else "DOP853"
+    sol = solve_ivp(attractor.rhs, (0, time), attractor.init_coords, method=method, dense_output=True, rtol=1e-6, atol=1e-9)
 
+    ts = np.linspace(0, time, steps + 1)
+    return np.vstack([sol.sol(ts), ts])
 
-def plot(attractor, data):
+
+def plot(attractor, data, fmt="png"):
     """
     Creates a plot of the simulation.
 
@@ -268,24 +552,34 @@ def plot(attractor, data):
         The strange attractor that is being simulated.
     data : numpy.ndarray
         The data for the plot, which contains the coordinates for the
-        entire simulation of the strange attractor.
+        entire simulation of the strange attractor. Data for N
+        trajectories, with shape (N, 4, steps + 1), is plotted as N
+        lines.
+    fmt : str
+        The file format of the plot, either "png" or "svg".
 
     Ouput
     -----
-    png
+    png or svg
         Image file containing a plot of the simulation.
 
     """
 
-    ax = plt.figure().add_subplot(projection="3d")
+    # Near collinear points are removed from the lines before they are
+    # drawn, which reduces the work of rasterising a PNG file and the
+    # size of the paths stored in an SVG file.
+    with plt.rc_context({"path.simplify": True, "path.simplify_threshold": 1.0}):
+        ax = plt.figure().add_subplot(projection="3d")
 
-    ax.plot(data[0], data[1], data[2], linewidth=1, color="rebeccapurple")
-    ax.tick_params(left=False, right=False, bottom=False, labelleft=False, labelright=False, labelbottom=False)
+        for trajectory in data.reshape(-1, 4, data.shape[-1]):
+            ax.plot(trajectory[0], trajectory[1], trajectory[2], linewidth=1, color="rebeccapurple")
+
+        ax.tick_params(left=False, right=False, bottom=False, labelleft=False, labelright=False, labelbottom=False)
 
-    plt.savefig(f"{attractor}.png")
+        plt.savefig(f"{attractor}.{fmt}", dpi=100)
 
 
-def animate(attractor, data, steps):
+def animate(attractor, data, steps, fmt="mp4"):
     """
     Creates an animation of the simulation.
 
@@ -295,55 +589,74 @@ def animate(attractor, data, steps):
         The strange attractor that is being simulated.
     data : numpy.ndarray
         The data for the animation, which contains the coordinates for
-        the entire simulation of the strange attractor.
+        the entire simulation of the strange attractor. Data for N
+        trajectories, with shape (N, 4, steps + 1), is animated as N
+        lines.
     steps : int
         The number of steps used in the simulation.
+    fmt : str
+        The file format of the animation, either "mp4" or "gif".
 
     Ouput
     -----
-    gif
-        GIF file containing an animation of the simulation.
-
+    mp4 or gif
+        MP4 or GIF file containing an animation of the simulation.
     """
 
-    def update_animation(frame, data, line):
+    def update_animation(frame, data, lines):
         """
-        Updates the line being plotted in the animation.
+        Updates the lines being plotted in the animation.
 
         Parameters
         ----------
         frame : int
-            The frame of the animation.
+            The number of steps to show in the frame.
         data : numpy.ndarray
             The data for the animation, which contains the coordinates
-            for the entire simulation of the strange attractor.
-        line : object mpl_toolkits.mplot3d.art3d.Line3D
-            The line being plotted in the animation.
+            for the entire simulation of N strange attractors, with shape
+            (N, 4, steps + 1).
+        lines : list[mpl_toolkits.mplot3d.art3d.Line3D]
+            The lines being plotted in the animation, one per trajectory.
 
         Returns
         -------
-        line : object mpl_toolkits.mplot3d.art3d.Line3D
-            The line being plotted in the animation.
+        lines : list[mpl_toolkits.mplot3d.art3d.Line3D]
+            The lines being plotted in the animation.
         """
 
-        line.set_data(data[:2, :frame])
-        line.set_3d_properties(data[2, :frame])
-        line.set_color("rebeccapurple")
+        for trajectory, line in zip(data, lines):
+            line.set_data_3d(trajectory[0, :frame], trajectory[1, :frame], trajectory[2, :frame])
 
-        return line
+        return lines
 
     fig = plt.figure()
     ax = fig.add_subplot(projection="3d")
 
-    line = ax.plot([], [], [])[0]
+    data = data.reshape(-1, 4, data.shape[-1])
+    lines = [ax.plot([], [], [], color="rebeccapurple")[0] for _ in data]
+
+    mins = data[:, :3].min(axis=(0, 2))
+    maxs = data[:, :3].max(axis=(0, 2))
 
-    ax.set(xlim3d=(min(data[0]), max(data[0])))
-    ax.set(ylim3d=(min(data[1]), max(data[1])))
-    ax.set(zlim3d=(min(data[2]), max(data[2])))
+    ax.set(xlim3d=(mins[0], maxs[0]), ylim3d=(mins[1], maxs[1]), zlim3d=(mins[2], maxs[2]))
     ax.tick_params(left=False, right=False, bottom=False, labelleft=False, labelright=False, labelbottom=False)
 
-    animate = FuncAnimation(fig, update_animation, steps, fargs=(data, line), interval=1)
-    animate.save(f"{attractor}.gif", fps=30)
+    # Render one frame per 1/30th of a second of simulation time, rather
+    # than one per step, revealing the steps evenly across the frames.
+    fps = _FPS
+    n_frames = fps * (steps // _STEPS_PER_SECOND["animation"])
+    frames = np.linspace(0, steps, n_frames, dtype=int)
+
+    # FFmpeg encodes MP4 files much faster than the PillowWriter encodes
+    # GIF files, which quantises the palette of every frame.
+    if fmt == "mp4":
+        writer = FFMpegWriter(fps=fps, codec="libx264", bitrate=1800, extra_args=["-pix_fmt", "yuv420p", "-preset", "veryfast"])
+
+    else:
+        writer = PillowWriter(fps=fps)
+
+    animate = FuncAnimation(fig, update_animation, frames, fargs=(data, lines), interval=1, blit=False)
+    animate.save(f"{attractor}.{fmt}", writer=writer, dpi=100)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 # Import needed libraries.
+import numpy as np
 import pytest
 
 # Import local modules.
@@ -6,9 +7,10 @@ from attractors.langford import LangfordAttractor
 from attractors.lorenz import LorenzAttractor
 from attractors.rossler import RosslerAttractor
 from attractors.sprott import SprottAttractor
+from attractors._codegen import literal
 
 # Import functions to be tested.
-from project import valid, calc_steps, get_attractor
+from project import valid, valid_sweep, calc_steps, get_attractor, simulate, sweep, runge_kutta_four, runge_kutta_four_specialised, solve_adaptive
 
 def test_valid():
     """
@@ -38,6 +40,38 @@ def test_valid():
     assert valid("animation", 40) == True
     assert valid("animation", 60) == True
 
+    # Test file formats.
+    with pytest.raises(ValueError):
+        valid("image", 1, "mp4")
+
+    with pytest.raises(ValueError):
+        valid("animation", 1, "svg")
+
+    assert valid("image", 1, "png") == True
+    assert valid("image", 1, "svg") == True
+    assert valid("animation", 1, "gif") == True
+    assert valid("animation", 1, "mp4") == True
+
+
+def test_valid_sweep():
+    """
+    Test the "valid_sweep" function.
+    """
+
+    # Test invalid cases.
+    invalid_sweeps = [["alpha", "1"], ["init_coords", "1"], ["rho"], ["rho", "high"]]
+
+    for sweep in invalid_sweeps:
+        with pytest.raises(ValueError):
+            valid_sweep("lorenz", sweep, "rk4")
+
+    with pytest.raises(ValueError):
+        valid_sweep("lorenz", ["rho", "20", "28"], "adaptive")
+
+    # Test valid cases.
+    assert valid_sweep("lorenz", ["rho", "20", "28"], "rk4") == True
+    assert valid_sweep("langford", ["f", "0.1"], "rk4") == True
+
 
 def test_calc_steps():
     """
@@ -70,3 +104,141 @@ def test_get_attractor():
     assert isinstance(get_attractor("lorenz"), LorenzAttractor)
     assert isinstance(get_attractor("rossler"), RosslerAttractor)
     assert isinstance(get_attractor("sprott"), SprottAttractor)
+
+    # Test the default initial coordinates are not shared between objects.
+    attractor = get_attractor("lorenz")
+    attractor.init_coords[0] = 1.0
+
+    assert np.allclose(get_attractor("lorenz").init_coords, [0.1, 0.1, 0.1])
+
+    # Test initial coordinates given as an array are copied.
+    init_coords = np.array([1.0, 1.0, 1.0])
+    attractor = get_attractor("lorenz", init_coords=init_coords)
+    init_coords[0] = 99.0
+
+    assert np.allclose(attractor.init_coords, [1.0, 1.0, 1.0])
+
+    with pytest.raises(ValueError):
+        get_attractor("lorenz", alpha=1.0)
+
+    # Test parameters are passed through to the object.
+    attractor = get_attractor("lorenz", rho=20.0, init_coords=[1.0, 1.0, 1.0])
+
+    assert attractor.rho == 20.0
+    assert np.allclose(attractor.init_coords, [1.0, 1.0, 1.0])
+
+
+def test_runge_kutta_four():
+    """
+    Test the "runge_kutta_four" function.
+    """
+
+    attractor = LorenzAttractor()
+    data = runge_kutta_four(attractor.deriv, 1, 100, attractor.init_coords)
+
+    # Test the shape of the returned data.
+    assert data.shape == (4, 101)
+
+    # Test the initial coordinates and the final time.
+    assert np.allclose(data[:3, 0], attractor.init_coords)
+    assert np.isclose(data[3, -1], 1)
+
+    # Test a batch of trajectories agrees with each single trajectory.
+    init_coords = [[0.1, 0.1, 0.1], [0.2, 0.0, -0.1]]
+    batch = runge_kutta_four(attractor.deriv, 1, 100, init_coords)
+
+    assert batch.shape == (2, 4, 101)
+
+    for trajectory, coords in zip(batch, init_coords):
+        assert np.allclose(trajectory, runge_kutta_four(attractor.deriv, 1, 100, coords))
+
+    # Test single precision simulations.
+    data = runge_kutta_four(attractor.deriv, 1, 100, attractor.init_coords, np.float32)
+
+    assert data.dtype == np.float32
+
+    # Test the intermediate states keep the precision of the simulation.
+    for coords in [attractor.init_coords, init_coords]:
+        dtypes = set()
+
+        def deriv(state):
+            dtypes.add(state.dtype)
+            return attractor.deriv(state)
+
+        runge_kutta_four(deriv, 1, 100, coords, np.float32)
+
+        assert dtypes == {np.dtype(np.float32)}
+
+
+def test_simulate():
+    """
+    Test the "simulate" function.
+    """
+
+    # Test the simulation agrees with the "runge_kutta_four" function.
+    for name in ["langford", "lorenz", "rossler", "sprott"]:
+        attractor = get_attractor(name)
+        expected = runge_kutta_four(attractor.deriv, 1, 100, attractor.init_coords)
+
+        assert np.allclose(simulate(name, attractor, 1, 100), expected)
+        assert simulate(name, attractor, 1, 100, np.float32).dtype == np.float32
+
+    # Test the simulation uses parameters changed after construction.
+    attractor = get_attractor("lorenz")
+    attractor.rho = 20.0
+
+    assert np.allclose(simulate("lorenz", attractor, 1, 100), runge_kutta_four(attractor.deriv, 1, 100, attractor.init_coords))
+
+
+def test_runge_kutta_four_specialised():
+    """
+    Test the "runge_kutta_four_specialised" function.
+    """
+
+    # Test the step is generated with the current parameters.
+    attractor = LorenzAttractor()
+    attractor.rho = 20.0
+
+    expected = runge_kutta_four(LorenzAttractor(rho=20.0).deriv, 1, 100, attractor.init_coords)
+
+    assert np.allclose(runge_kutta_four_specialised(attractor.rk4_step(), 1, 100, attractor.init_coords), expected)
+
+    # Test negative parameters are substituted correctly.
+    assert literal(-1.5) == "(-1.5)"
+
+    attractor = RosslerAttractor(a=-0.2, b=-0.2, c=-5.7)
+    expected = runge_kutta_four(attractor.deriv, 1, 100, attractor.init_coords)
+
+    assert np.allclose(runge_kutta_four_specialised(attractor.rk4_step(), 1, 100, attractor.init_coords), expected)
+
+
+def test_solve_adaptive():
+    """
+    Test the "solve_adaptive" function.
+    """
+
+    attractor = RosslerAttractor()
+    data = solve_adaptive("rossler", attractor, 1, 100)
+
+    # Test the solution agrees with the "runge_kutta_four" function.
+    assert data.shape == (4, 101)
+    assert np.allclose(data, runge_kutta_four(attractor.deriv, 1, 100, attractor.init_coords), atol=1e-6)
+
+
+def test_sweep():
+    """
+    Test the "sweep" function.
+    """
+
+    # Test invalid case.
+    with pytest.raises(ValueError):
+        sweep("lorenz", [], 1, 100)
+
+    # Test each simulation agrees with the "simulate" function.
+    param_grid = [{"rho": 20.0}, {"rho": 28.0}]
+    data = sweep("lorenz", param_grid, 1, 100)
+
+    assert data.shape == (2, 4, 101)
+
+    for trajectory, params in zip(data, param_grid):
+        assert np.allclose(trajectory, simulate("lorenz", get_attractor("lorenz", **params), 1, 100))